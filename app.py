@@ -1,61 +1,460 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.client
 import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import mmap
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from urllib import error, request
+from typing import BinaryIO, Iterator
 from urllib.parse import urlparse
 
-DATA_PATH = Path("data/comments_store.json")
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json module is the fallback
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows, which then runs a single worker process
+    fcntl = None
+
+DATA_DIR = Path("data")
+COMMENTS_PATH = DATA_DIR / "comments.jsonl"
+CONSOLIDATED_PATH = DATA_DIR / "consolidated.jsonl"
+SUMMARY_PATH = DATA_DIR / "summary.json"
+SUMMARY_ERROR_PATH = DATA_DIR / "summary_error.json"
+LEGACY_STORE_PATH = DATA_DIR / "comments_store.json"
+STORE_LOCK_PATH = DATA_DIR / ".store.lock"
+OPENAI_CACHE_PATH = DATA_DIR / "oai_cache.json"
 HOST = "0.0.0.0"
 PORT = 8501
+KEEP_ALIVE_TIMEOUT = 15
+WORKERS = os.cpu_count() or 1
 OPENAI_URL = "https://api.openai.com/v1/chat/completions"
 OPENAI_MODEL = "gpt-4o-mini"
+OPENAI_TIMEOUT = 45
+OPENAI_MAX_RETRIES = 3
+OPENAI_RETRY_STATUSES = {429, 500, 502, 503, 504}
+OPENAI_POOL_SIZE = 8
+OPENAI_CACHE_SIZE = 2048
+COMMENT_BATCH_MAX_SIZE = 50
+# Small JSON bodies are not worth the compression CPU.
+GZIP_MIN_SIZE = 1024
+DEFAULT_TONE_RULES = "Use professional and consistent tone with strong readability."
 BUILD_ID = "2026-02-19-cachefix"
 
 
-@dataclass
-class Comment:
-    id: int
-    text: str
-    created_at: str
+def utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-@dataclass
-class ConsolidatedComment:
-    comment_id: int
-    consolidated_text: str
-    created_at: str
+# Guards the in-memory store cache; reentrant so helpers can be called by lock holders.
+_STORE_LOCK = threading.RLock()
+_STORE: dict | None = None
+# Set in worker processes that share the data files; store access then also takes an flock on it.
+_store_lock_file: BinaryIO | None = None
+_store_lock_depth = 0
+# Reset counter kept in the lock file; a reset can give the new files a recycled inode, so this is what detects it.
+_store_epoch = 0
+# (inode, size, mtime_ns) of each data file as last read or written by this process.
+_file_marks: dict[Path, tuple[int, int, int] | None] = {}
+# A single worker keeps summary refreshes ordered, so an older one never overwrites a newer one.
+_SUMMARY_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+_summary_pending = 0
+# Serialized /api/state body (and its gzip form), rebuilt lazily after any mutation.
+_STATE_JSON: bytes | None = None
+_STATE_GZ: bytes | None = None
+_store_generation = 0
+_OAI_POOL = ThreadPoolExecutor(max_workers=OPENAI_POOL_SIZE, thread_name_prefix="openai")
 
 
-def utc_now() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds")
+if orjson is not None:
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
 
 
 def empty_store() -> dict:
-    return {"comments": [], "consolidated_comments": [], "executive_summaries": []}
+    # Rows: comments {id, text, created_at}; consolidated_comments {comment_id, consolidated_text, created_at};
+    # executive_summaries {summary_text, created_at, comment_count}.
+    # "summary_error" is the last failed summary refresh {error, comment_count, created_at}, or None.
+    # "_context_cache" holds the consolidated comments pre-formatted as prompt context; it is never persisted.
+    return {
+        "comments": [],
+        "consolidated_comments": [],
+        "executive_summaries": [],
+        "summary_error": None,
+        "_context_cache": "",
+    }
 
 
-def ensure_store() -> None:
-    DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    if not DATA_PATH.exists():
-        DATA_PATH.write_text(json.dumps(empty_store(), indent=2), encoding="utf-8")
+def _context_lines(consolidated_comments: list[dict]) -> str:
+    return "".join(f"- {row['consolidated_text']}\n" for row in consolidated_comments)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Per-process temp name: worker processes may write the same file at the same time.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _append_jsonl(path: Path, rows: list[dict]) -> None:
+    lines = b"".join(_dumps(row) + b"\n" for row in rows)
+    with open(path, "ab") as f:
+        f.write(lines)
+
+
+def _read_jsonl(path: Path, offset: int = 0) -> list[dict]:
+    if not path.exists():
+        return []
+    rows = []
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= offset:
+            return rows
+        # Parse line by line straight from the mapping instead of reading the whole file into memory.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, end = offset, len(mm)
+            while pos < end:
+                newline = mm.find(b"\n", pos)
+                if newline == -1:
+                    # Unterminated last line from an interrupted append: not a complete row.
+                    break
+                line = mm[pos:newline]
+                if line.strip():
+                    rows.append(_loads(line))
+                pos = newline + 1
+    return rows
+
+
+def _drop_torn_tail(path: Path) -> None:
+    # A crash or full disk mid-append can leave an unterminated last line; cut it so the next append
+    # starts on a fresh line instead of being glued to the fragment.
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            keep = mm.rfind(b"\n") + 1
+        f.truncate(keep)
+    print(f"Dropped an incomplete trailing line from {path}", file=sys.stderr)
 
 
-def load_store() -> dict:
-    ensure_store()
-    return json.loads(DATA_PATH.read_text(encoding="utf-8"))
+def _migrate_legacy_store() -> None:
+    if not LEGACY_STORE_PATH.exists() or COMMENTS_PATH.exists():
+        return
+    legacy = _loads(LEGACY_STORE_PATH.read_bytes())
+    # Every file is written whole, so an interrupted migration is simply redone on the next start.
+    _write_atomic(CONSOLIDATED_PATH, b"".join(_dumps(row) + b"\n" for row in legacy.get("consolidated_comments", [])))
+    _write_atomic(SUMMARY_PATH, _dumps(legacy.get("executive_summaries", [])))
+    # Comments go last: their file existing marks the migration as done.
+    _write_atomic(COMMENTS_PATH, b"".join(_dumps(row) + b"\n" for row in legacy.get("comments", [])))
 
 
-def save_store(store: dict) -> None:
-    DATA_PATH.write_text(json.dumps(store, indent=2, ensure_ascii=False), encoding="utf-8")
+def _file_mark(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _remember_files(*paths: Path) -> None:
+    for path in paths:
+        _file_marks[path] = _file_mark(path)
+
+
+def load_store() -> dict:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _migrate_legacy_store()
+    for path in (COMMENTS_PATH, CONSOLIDATED_PATH):
+        _drop_torn_tail(path)
+    store = empty_store()
+    store["comments"] = _read_jsonl(COMMENTS_PATH)
+    store["consolidated_comments"] = _read_jsonl(CONSOLIDATED_PATH)
+    store["_context_cache"] = _context_lines(store["consolidated_comments"])
+    if SUMMARY_PATH.exists():
+        store["executive_summaries"] = _loads(SUMMARY_PATH.read_bytes())
+    if SUMMARY_ERROR_PATH.exists():
+        store["summary_error"] = _loads(SUMMARY_ERROR_PATH.read_bytes())
+    _remember_files(COMMENTS_PATH, CONSOLIDATED_PATH, SUMMARY_PATH, SUMMARY_ERROR_PATH)
+    return store
+
+
+def _read_store_epoch() -> int:
+    data = os.pread(_store_lock_file.fileno(), 32, 0)
+    return int(data) if data.strip() else 0
+
+
+def _write_store_epoch(epoch: int) -> None:
+    # Caller must hold the flock. The file is in append mode, so after truncating the write lands at offset 0.
+    fd = _store_lock_file.fileno()
+    os.ftruncate(fd, 0)
+    os.write(fd, b"%d" % epoch)
+
+
+def _reload_store() -> None:
+    global _STORE, _store_generation
+    _store_generation += 1
+    _STORE = load_store()
+    _invalidate_state()
+
+
+def _sync_store() -> None:
+    # Pick up writes made by other worker processes since this process last touched the files.
+    # Caller must hold the flock.
+    global _store_epoch
+    if _STORE is None:
+        return
+    epoch = _read_store_epoch()
+    if epoch != _store_epoch:
+        # Another worker reset the store: start over from disk.
+        _store_epoch = epoch
+        _reload_store()
+        return
+    changed = False
+    for key, path in (("comments", COMMENTS_PATH), ("consolidated_comments", CONSOLIDATED_PATH)):
+        known, current = _file_marks.get(path), _file_mark(path)
+        if current == known:
+            continue
+        if known is None or current is None or current[0] != known[0] or current[1] < known[1]:
+            _reload_store()
+            return
+        try:
+            rows = _read_jsonl(path, offset=known[1])
+        except ValueError:
+            # The offset no longer falls on a row boundary, so the file is not the one we were reading.
+            _reload_store()
+            return
+        _STORE[key].extend(rows)
+        if key == "consolidated_comments":
+            _STORE["_context_cache"] += _context_lines(rows)
+        _file_marks[path] = current
+        changed = True
+    current = _file_mark(SUMMARY_PATH)
+    if current != _file_marks.get(SUMMARY_PATH):
+        _STORE["executive_summaries"] = _loads(SUMMARY_PATH.read_bytes()) if current else []
+        _file_marks[SUMMARY_PATH] = current
+        changed = True
+    current = _file_mark(SUMMARY_ERROR_PATH)
+    if current != _file_marks.get(SUMMARY_ERROR_PATH):
+        _STORE["summary_error"] = _loads(SUMMARY_ERROR_PATH.read_bytes()) if current else None
+        _file_marks[SUMMARY_ERROR_PATH] = current
+        changed = True
+    if changed:
+        _invalidate_state()
+
+
+def get_store() -> dict:
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = load_store()
+        return _STORE
+
+
+@contextmanager
+def locked_store() -> Iterator[dict]:
+    # Exclusive access to the store; across worker processes too when they share the data files.
+    global _store_lock_depth
+    with _STORE_LOCK:
+        outermost = _store_lock_depth == 0 and _store_lock_file is not None
+        if outermost:
+            fcntl.flock(_store_lock_file, fcntl.LOCK_EX)
+        _store_lock_depth += 1
+        try:
+            if outermost:
+                _sync_store()
+            yield get_store()
+        finally:
+            _store_lock_depth -= 1
+            if outermost:
+                fcntl.flock(_store_lock_file, fcntl.LOCK_UN)
+
+
+def append_comments(comments: list[dict], consolidated_comments: list[dict]) -> None:
+    with locked_store() as store:
+        _append_jsonl(COMMENTS_PATH, comments)
+        _append_jsonl(CONSOLIDATED_PATH, consolidated_comments)
+        _remember_files(COMMENTS_PATH, CONSOLIDATED_PATH)
+        store["comments"].extend(comments)
+        store["consolidated_comments"].extend(consolidated_comments)
+        store["_context_cache"] += _context_lines(consolidated_comments)
+        _invalidate_state()
+
+
+def save_executive_summaries(summaries: list[dict]) -> None:
+    with locked_store() as store:
+        _write_atomic(SUMMARY_PATH, _dumps(summaries))
+        SUMMARY_ERROR_PATH.unlink(missing_ok=True)
+        _remember_files(SUMMARY_PATH, SUMMARY_ERROR_PATH)
+        store["executive_summaries"] = summaries
+        store["summary_error"] = None
+        _invalidate_state()
+
+
+def save_summary_error(error: dict) -> None:
+    with locked_store() as store:
+        _write_atomic(SUMMARY_ERROR_PATH, _dumps(error))
+        _remember_files(SUMMARY_ERROR_PATH)
+        store["summary_error"] = error
+        _invalidate_state()
 
 
 def reset_store() -> None:
-    save_store(empty_store())
+    global _STORE, _store_generation, _store_epoch
+    with locked_store():
+        _store_generation += 1
+        if _store_lock_file is not None:
+            _store_epoch += 1
+            _write_store_epoch(_store_epoch)
+        for path in (COMMENTS_PATH, CONSOLIDATED_PATH):
+            _write_atomic(path, b"")
+        _write_atomic(SUMMARY_PATH, b"[]")
+        SUMMARY_ERROR_PATH.unlink(missing_ok=True)
+        _remember_files(COMMENTS_PATH, CONSOLIDATED_PATH, SUMMARY_PATH, SUMMARY_ERROR_PATH)
+        _STORE = empty_store()
+        _invalidate_state()
+
+
+def _invalidate_state() -> None:
+    # Caller must hold _STORE_LOCK.
+    global _STATE_JSON, _STATE_GZ
+    _STATE_JSON = None
+    _STATE_GZ = None
+
+
+def _summary_behind(store: dict) -> bool:
+    # True while some worker has yet to summarize the newest comments; every worker sees the same files.
+    count = len(store["consolidated_comments"])
+    error = store["summary_error"]
+    if error is not None and error["comment_count"] >= count:
+        # The refresh covering the newest comments failed; nothing more is coming until the next comment.
+        return False
+    summaries = store["executive_summaries"]
+    if not summaries:
+        return count > 0
+    # Summaries saved before comment_count existed count as current.
+    return summaries[-1].get("comment_count", count) < count
+
+
+def state_json() -> bytes:
+    # Caller must hold locked_store().
+    global _STATE_JSON
+    if _STATE_JSON is None:
+        store = get_store()
+        _STATE_JSON = _dumps(
+            {
+                "comments": store["comments"],
+                "consolidated_comments": store["consolidated_comments"],
+                "executive_summaries": store["executive_summaries"],
+                "summary_pending": _summary_pending > 0 or _summary_behind(store),
+                "summary_error": store["summary_error"]["error"] if store["summary_error"] else None,
+            }
+        )
+    return _STATE_JSON
+
+
+def state_json_gz() -> bytes:
+    # Caller must hold locked_store().
+    global _STATE_GZ
+    if _STATE_GZ is None:
+        _STATE_GZ = gzip.compress(state_json(), 5)
+    return _STATE_GZ
+
+
+_openai_idle: list[http.client.HTTPSConnection] = []
+_openai_idle_lock = threading.Lock()
+
+
+def _acquire_openai_connection() -> tuple[http.client.HTTPSConnection, bool]:
+    # Returns the connection and whether it was reused from the idle pool.
+    with _openai_idle_lock:
+        if _openai_idle:
+            return _openai_idle.pop(), True
+    return http.client.HTTPSConnection(urlparse(OPENAI_URL).netloc, timeout=OPENAI_TIMEOUT), False
+
+
+def _release_openai_connection(conn: http.client.HTTPSConnection) -> None:
+    with _openai_idle_lock:
+        if len(_openai_idle) < OPENAI_POOL_SIZE:
+            _openai_idle.append(conn)
+            return
+    conn.close()
+
+
+def _open_openai(api_key: str, payload: dict) -> tuple[http.client.HTTPSConnection, http.client.HTTPResponse]:
+    body = _dumps(payload)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    path = urlparse(OPENAI_URL).path
+    attempt = 0
+    while True:
+        conn, reused = _acquire_openai_connection()
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            conn.close()
+            # A pooled socket the server closed while idle fails before any response; retry at once on
+            # another one. Anything else (timeouts included) may have reached OpenAI and is not re-sent.
+            if reused:
+                continue
+            raise
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+        if resp.status not in OPENAI_RETRY_STATUSES or attempt >= OPENAI_MAX_RETRIES:
+            return conn, resp
+        _finish_openai_response(conn, resp)
+        time.sleep(0.2 * (2**attempt))
+        attempt += 1
+
+
+def _finish_openai_response(conn: http.client.HTTPSConnection, resp: http.client.HTTPResponse) -> bytes:
+    try:
+        data = resp.read()
+    except (http.client.HTTPException, OSError):
+        conn.close()
+        raise
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_openai_connection(conn)
+    return data
+
+
+def _post_openai(api_key: str, payload: dict) -> tuple[int, bytes]:
+    conn, resp = _open_openai(api_key, payload)
+    return resp.status, _finish_openai_response(conn, resp)
 
 
 def call_openai(api_key: str, system_prompt: str, user_prompt: str) -> str:
@@ -67,24 +466,19 @@ def call_openai(api_key: str, system_prompt: str, user_prompt: str) -> str:
             {"role": "user", "content": user_prompt},
         ],
     }
-    req = request.Request(
-        OPENAI_URL,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
 
     try:
-        with request.urlopen(req, timeout=45) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"OpenAI HTTPError {exc.code}: {detail}") from exc
+        status, raw = _post_openai(api_key, payload)
     except Exception as exc:
         raise RuntimeError(f"OpenAI request failed: {exc}") from exc
+    if not 200 <= status < 300:
+        detail = raw.decode("utf-8", errors="ignore")
+        raise RuntimeError(f"OpenAI HTTPError {status}: {detail}")
+
+    try:
+        data = _loads(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"OpenAI returned invalid JSON: {exc}") from exc
 
     try:
         return data["choices"][0]["message"]["content"].strip()
@@ -92,6 +486,126 @@ def call_openai(api_key: str, system_prompt: str, user_prompt: str) -> str:
         raise RuntimeError(f"Unexpected OpenAI response: {data}") from exc
 
 
+_openai_cache: OrderedDict[str, str] = OrderedDict()
+_openai_cache_lock = threading.Lock()
+
+
+def _openai_cache_key(api_key: str, system_prompt: str, user_prompt: str) -> str:
+    # The API key is hashed in so an invalid or revoked key never gets answers cached under a valid one.
+    raw = f"{OPENAI_MODEL}\0{api_key}\0{system_prompt}\0{user_prompt}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _call_openai_cached(api_key: str, system_prompt: str, user_prompt: str) -> str:
+    # Only for prompts whose answer depends on nothing but the prompt text (not Q&A or summaries).
+    key = _openai_cache_key(api_key, system_prompt, user_prompt)
+    with _openai_cache_lock:
+        if key in _openai_cache:
+            _openai_cache.move_to_end(key)
+            return _openai_cache[key]
+    result = call_openai(api_key, system_prompt, user_prompt)
+    with _openai_cache_lock:
+        _openai_cache[key] = result
+        while len(_openai_cache) > OPENAI_CACHE_SIZE:
+            _openai_cache.popitem(last=False)
+    return result
+
+
+def _read_openai_cache_file() -> dict[str, str]:
+    if not OPENAI_CACHE_PATH.exists():
+        return {}
+    try:
+        return _loads(OPENAI_CACHE_PATH.read_bytes())
+    except ValueError:
+        return {}
+
+
+def load_openai_cache() -> None:
+    entries = _read_openai_cache_file()
+    with _openai_cache_lock:
+        _openai_cache.update(list(entries.items())[-OPENAI_CACHE_SIZE:])
+
+
+def save_openai_cache() -> None:
+    with _openai_cache_lock:
+        ours = list(_openai_cache.items())
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    # Worker processes save on shutdown too: merge with what is on disk instead of overwriting it.
+    with locked_store():
+        merged = _read_openai_cache_file()
+        for key, value in ours:
+            merged.pop(key, None)
+            merged[key] = value
+        _write_atomic(OPENAI_CACHE_PATH, _dumps(dict(list(merged.items())[-OPENAI_CACHE_SIZE:])))
+
+
+def call_openai_stream(api_key: str, system_prompt: str, user_prompt: str) -> Iterator[str]:
+    payload = {
+        "model": OPENAI_MODEL,
+        "temperature": 0.2,
+        "stream": True,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+    }
+
+    # Connect eagerly so request/HTTP errors surface before the caller starts responding.
+    try:
+        conn, resp = _open_openai(api_key, payload)
+    except Exception as exc:
+        raise RuntimeError(f"OpenAI request failed: {exc}") from exc
+    if not 200 <= resp.status < 300:
+        try:
+            detail = _finish_openai_response(conn, resp).decode("utf-8", errors="ignore")
+        except Exception as exc:
+            raise RuntimeError(f"OpenAI request failed: {exc}") from exc
+        raise RuntimeError(f"OpenAI HTTPError {resp.status}: {detail}")
+    return _iter_openai_stream(conn, resp)
+
+
+def _iter_openai_stream(conn: http.client.HTTPSConnection, resp: http.client.HTTPResponse) -> Iterator[str]:
+    completed = False
+    try:
+        for line in resp:
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            try:
+                choices = _loads(data).get("choices") or []
+                delta = choices[0]["delta"].get("content") if choices else None
+            except (ValueError, KeyError, AttributeError) as exc:
+                raise RuntimeError(f"Unexpected OpenAI stream event: {data!r}") from exc
+            if delta:
+                yield delta
+        completed = True
+    except (http.client.HTTPException, OSError) as exc:
+        raise RuntimeError(f"OpenAI stream failed: {exc}") from exc
+    finally:
+        if completed:
+            _finish_openai_response(conn, resp)
+        else:
+            conn.close()
+
+
+def call_openai_many(api_key: str, prompts: list[tuple[str, str]]) -> list[str]:
+    # Independent prompts run concurrently over the connection pool; results keep the input order.
+    futures = [
+        _OAI_POOL.submit(_call_openai_cached, api_key, system_prompt, user_prompt) for system_prompt, user_prompt in prompts
+    ]
+    return [future.result() for future in futures]
+
+
+# Models sometimes wrap JSON answers in markdown code fences.
+_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
+
+def _loads_model_json(raw: str) -> object:
+    return _loads(_JSON_FENCE.sub("", raw))
+
+
 def improve_comment_with_openai(api_key: str, comment_text: str, improvement_rules: str) -> dict:
     system_prompt = (
         "You are an expert financial reporting coach. "
@@ -112,9 +626,9 @@ Return ONLY valid JSON with this exact schema:
   "missing_information": ["missing item 1", "missing item 2"]
 }}
 """.strip()
-    raw = call_openai(api_key, system_prompt, user_prompt)
+    raw = _call_openai_cached(api_key, system_prompt, user_prompt)
     try:
-        return json.loads(raw)
+        return _loads_model_json(raw)
     except json.JSONDecodeError:
         return {
             "quality_assessment": "Model output was not strict JSON. Showing raw output.",
@@ -124,14 +638,15 @@ Return ONLY valid JSON with this exact schema:
         }
 
 
-def translate_to_english_with_openai(api_key: str, text: str) -> str:
+def _translation_prompts(text: str) -> tuple[str, str]:
     system_prompt = "Translate user comments into clear, professional English. Output only translated text."
     user_prompt = f"Translate to English:\n{text}"
-    return call_openai(api_key, system_prompt, user_prompt)
+    return system_prompt, user_prompt
 
 
-def consolidate_comment_with_openai(api_key: str, text: str, tone_rules: str) -> str:
+def _consolidation_prompts(text: str, tone_rules: str, in_english: bool = False) -> tuple[str, str]:
     system_prompt = "You standardize controller comments for consistency, readability, and professional tone."
+    language = "Write the consolidated comment in English.\n" if in_english else ""
     user_prompt = f"""
 Tone/style rules:
 {tone_rules}
@@ -139,17 +654,121 @@ Tone/style rules:
 Comment to consolidate:
 {text}
 
-Return only the final consolidated comment.
+{language}Return only the final consolidated comment.
 """.strip()
-    return call_openai(api_key, system_prompt, user_prompt)
+    return system_prompt, user_prompt
+
+
+def consolidate_comment_with_openai(api_key: str, text: str, tone_rules: str) -> str:
+    return _call_openai_cached(api_key, *_consolidation_prompts(text, tone_rules))
+
+
+def process_comment_with_openai(api_key: str, text: str, tone_rules: str, normalize_english: bool) -> dict:
+    system_prompt = (
+        "You standardize controller comments for consistency, readability, and professional tone. "
+        "Return strict JSON."
+    )
+    translate_step = (
+        "1. Translate the comment into clear, professional English (keep it unchanged if already English).\n"
+        if normalize_english
+        else "1. Keep the comment exactly as written.\n"
+    )
+    user_prompt = f"""
+Tone/style rules:
+{tone_rules}
+
+Comment:
+{text}
+
+Steps:
+{translate_step}2. Consolidate the result of step 1 following the tone/style rules.
+
+Return ONLY valid JSON with this exact schema:
+{{
+  "translated": "result of step 1",
+  "consolidated": "final consolidated comment"
+}}
+""".strip()
+    raw = _call_openai_cached(api_key, system_prompt, user_prompt)
+    try:
+        result = _loads_model_json(raw)
+        translated = result["translated"] if normalize_english else text
+        consolidated = result["consolidated"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return _process_comment_separately(api_key, text, tone_rules, normalize_english)
+    return {"translated": translated, "consolidated": consolidated}
+
+
+def _process_comment_separately(api_key: str, text: str, tone_rules: str, normalize_english: bool) -> dict:
+    # Fallback when the fused output is unusable; translation and consolidation are issued concurrently.
+    if not normalize_english:
+        return {"translated": text, "consolidated": consolidate_comment_with_openai(api_key, text, tone_rules)}
+    translated, consolidated = call_openai_many(
+        api_key,
+        [_translation_prompts(text), _consolidation_prompts(text, tone_rules, in_english=True)],
+    )
+    return {"translated": translated, "consolidated": consolidated}
+
+
+def consolidate_batch_with_openai(api_key: str, texts: list[str], tone_rules: str, normalize_english: bool) -> list[dict]:
+    system_prompt = (
+        "You standardize controller comments for consistency, readability, and professional tone. "
+        "Return strict JSON."
+    )
+    translate_step = (
+        "1. Translate each comment into clear, professional English (keep it unchanged if already English).\n"
+        if normalize_english
+        else "1. Keep each comment exactly as written.\n"
+    )
+    items = json.dumps([{"i": i, "text": t} for i, t in enumerate(texts)], ensure_ascii=False)
+    user_prompt = f"""
+Tone/style rules:
+{tone_rules}
+
+Comments (JSON array):
+{items}
+
+Steps, for every comment independently:
+{translate_step}2. Consolidate the result of step 1 following the tone/style rules.
+
+Return ONLY a valid JSON array with one object per comment, using this exact schema:
+[{{"i": 0, "translated": "result of step 1", "consolidated": "final consolidated comment"}}]
+""".strip()
+    raw = _call_openai_cached(api_key, system_prompt, user_prompt)
+
+    results: list[dict | None] = [None] * len(texts)
+    try:
+        rows = _loads_model_json(raw)
+    except json.JSONDecodeError:
+        rows = []
+    for row in rows if isinstance(rows, list) else []:
+        try:
+            i, translated, consolidated = row["i"], row["translated"], row["consolidated"]
+        except (KeyError, TypeError):
+            continue
+        if isinstance(i, int) and 0 <= i < len(texts):
+            results[i] = {"translated": translated if normalize_english else texts[i], "consolidated": consolidated}
+
+    # Items the model dropped or mangled fall back to separate calls, issued concurrently.
+    missing = [i for i, result in enumerate(results) if result is None]
+    prompts = []
+    for i in missing:
+        if normalize_english:
+            prompts.append(_translation_prompts(texts[i]))
+        prompts.append(_consolidation_prompts(texts[i], tone_rules, in_english=normalize_english))
+    answers = iter(call_openai_many(api_key, prompts))
+    for i in missing:
+        translated = next(answers) if normalize_english else texts[i]
+        results[i] = {"translated": translated, "consolidated": next(answers)}
+    return results
 
 
 def update_executive_summary_with_openai(store: dict, api_key: str) -> None:
-    comments = store.get("consolidated_comments", [])
-    if not comments:
+    # store is the snapshot taken by _refresh_executive_summary: the prompt context and its comment count.
+    context = store.get("_context_cache", "")
+    if not context:
         summary_text = "No consolidated comments available yet."
     else:
-        context = "\n".join(f"- {row['consolidated_text']}" for row in comments)
         system_prompt = "You write executive summaries for management reporting."
         user_prompt = (
             "Create one concise executive summary in English based on all consolidated comments below.\n"
@@ -158,22 +777,67 @@ def update_executive_summary_with_openai(store: dict, api_key: str) -> None:
         )
         summary_text = call_openai(api_key, system_prompt, user_prompt)
 
-    store["executive_summaries"] = [{"summary_text": summary_text, "created_at": utc_now()}]
+    store["executive_summaries"] = [
+        {"summary_text": summary_text, "created_at": utc_now(), "comment_count": store["comment_count"]}
+    ]
+
+
+def _refresh_executive_summary(api_key: str, generation: int) -> None:
+    global _summary_pending
+    try:
+        with locked_store() as store:
+            if generation != _store_generation:
+                return
+            # Refreshes queue up while one is running, and the first to run covers every comment saved by then.
+            latest = store["executive_summaries"][-1:]
+            if latest and latest[0].get("comment_count", 0) >= len(store["consolidated_comments"]):
+                return
+            snapshot = {"_context_cache": store["_context_cache"], "comment_count": len(store["consolidated_comments"])}
+        try:
+            update_executive_summary_with_openai(snapshot, api_key)
+        except RuntimeError as exc:
+            print(f"Executive summary update failed: {exc}", file=sys.stderr)
+            with locked_store():
+                if generation == _store_generation:
+                    save_summary_error(
+                        {"error": str(exc), "comment_count": snapshot["comment_count"], "created_at": utc_now()}
+                    )
+            return
+        with locked_store() as store:
+            # Drop the result if the store was reset while the summary was being generated (syncing bumps the
+            # generation for resets made by other workers too), or if another worker saved a newer summary.
+            if generation != _store_generation:
+                return
+            latest = store["executive_summaries"][-1:]
+            if latest and latest[0].get("comment_count", 0) >= snapshot["comment_count"]:
+                return
+            save_executive_summaries(snapshot["executive_summaries"])
+    finally:
+        with _STORE_LOCK:
+            _summary_pending -= 1
+            _invalidate_state()
+
+
+def schedule_executive_summary_refresh(api_key: str) -> None:
+    # Caller must hold locked_store().
+    global _summary_pending
+    _summary_pending += 1
+    _invalidate_state()
+    _SUMMARY_EXECUTOR.submit(_refresh_executive_summary, api_key, _store_generation)
 
 
-def answer_question_with_openai(api_key: str, question: str, consolidated_comments: list[dict]) -> str:
-    if not consolidated_comments:
-        return "No consolidated comments available for analysis yet."
+def answer_question_with_openai(api_key: str, question: str, context: str) -> Iterator[str]:
+    if not context:
+        return iter(["No consolidated comments available for analysis yet."])
 
-    context = "\n".join(f"- {row['consolidated_text']}" for row in consolidated_comments)
     system_prompt = "You are an analytical assistant. Answer with evidence from provided consolidated comments only."
     user_prompt = (
         f"Question:\n{question}\n\n"
         "Consolidated comments context:\n"
-        f"{context}\n\n"
+        f"{context}\n"
         "Provide a concise analysis in English."
     )
-    return call_openai(api_key, system_prompt, user_prompt)
+    return call_openai_stream(api_key, system_prompt, user_prompt)
 
 
 INDEX_HTML = """
@@ -325,6 +989,8 @@ INDEX_HTML = """
 
 <script>
 let improvementReady = false;
+let summaryPoll = null;
+let summaryPolls = 0;
 
 function getConfig() {
   return {
@@ -403,7 +1069,8 @@ function renderMarkdownSimple(text) {
   return html;
 }
 
-async function refresh() {
+async function refresh(fromPoll) {
+  if (!fromPoll) summaryPolls = 0;
   const state = await api('/api/state');
   document.getElementById('commentsTable').innerHTML = tableFromRows(state.comments);
   document.getElementById('consolidatedTable').innerHTML = tableFromRows(state.consolidated_comments);
@@ -413,7 +1080,15 @@ async function refresh() {
     : null;
 
   document.getElementById('summaryText').innerHTML = renderMarkdownSimple(latestSummary ? latestSummary.summary_text : 'No executive summary generated yet.');
-  document.getElementById('summaryMeta').innerText = latestSummary ? `Updated at: ${latestSummary.created_at}` : '';
+  let summaryMeta = latestSummary ? `Updated at: ${latestSummary.created_at}` : '';
+  if (state.summary_pending) summaryMeta = 'Updating executive summary...';
+  else if (state.summary_error) summaryMeta = `Summary update failed: ${state.summary_error}`;
+  document.getElementById('summaryMeta').innerText = summaryMeta;
+
+  clearTimeout(summaryPoll);
+  // Capped so a worker that died mid-refresh does not keep the page polling forever.
+  if (state.summary_pending && summaryPolls++ < 120) summaryPoll = setTimeout(() => refresh(true), 1000);
+  else if (state.summary_pending) document.getElementById('summaryMeta').innerText = 'Executive summary is still updating; reload the page to check again.';
 }
 
 async function resetAllData() {
@@ -463,7 +1138,7 @@ async function saveComment() {
     return;
   }
 
-  msg.innerText = 'Comment saved successfully. Consolidated table and executive summary were auto-updated.';
+  msg.innerText = 'Comment saved successfully. Consolidated table was updated; executive summary is refreshing in the background.';
   improvementReady = false;
   document.getElementById('commentText').value = '';
   refresh();
@@ -477,8 +1152,25 @@ function useRevisedComment() {
 async function askQuestion() {
   const cfg = getConfig();
   const q = document.getElementById('question').value;
-  const res = await api('/api/ask', 'POST', { question: q, api_key: cfg.apiKey });
-  document.getElementById('answer').innerText = res.answer || res.error || 'No answer.';
+  const answerEl = document.getElementById('answer');
+  answerEl.innerText = '';
+  const res = await fetch('/api/ask', {method:'POST', headers:{'Content-Type':'application/json'}, body: JSON.stringify({ question: q, api_key: cfg.apiKey })});
+  if ((res.headers.get('Content-Type') || '').startsWith('application/json')) {
+    const data = await res.json();
+    answerEl.innerText = data.answer || data.error || 'No answer.';
+    return;
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let text = '';
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    text += decoder.decode(value, { stream: true });
+    answerEl.innerText = text;
+  }
+  answerEl.innerText = text || 'No answer.';
 }
 
 document.getElementById('commentText').addEventListener('input', () => { improvementReady = false; });
@@ -488,62 +1180,140 @@ refresh();
 </html>
 """
 
+_INDEX_BYTES = INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = '"' + hashlib.sha256(_INDEX_BYTES).hexdigest()[:16] + '"'
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, 9)
+_INDEX_GZ_ETAG = _INDEX_ETAG[:-1] + '-gzip"'
+
+# Prebuilt header blocks (without Content-Length) for Handler._write_response.
+_INDEX_304_HEADERS = f"ETag: {_INDEX_ETAG}\r\nCache-Control: no-cache\r\nVary: Accept-Encoding\r\n".encode()
+_INDEX_GZ_304_HEADERS = f"ETag: {_INDEX_GZ_ETAG}\r\nCache-Control: no-cache\r\nVary: Accept-Encoding\r\n".encode()
+_INDEX_HEADERS = b"Content-Type: text/html; charset=utf-8\r\n" + _INDEX_304_HEADERS
+_INDEX_GZ_HEADERS = b"Content-Type: text/html; charset=utf-8\r\nContent-Encoding: gzip\r\n" + _INDEX_GZ_304_HEADERS
+_JSON_HEADERS = b"Content-Type: application/json; charset=utf-8\r\nCache-Control: no-store\r\nVary: Accept-Encoding\r\n"
+_JSON_GZ_HEADERS = _JSON_HEADERS + b"Content-Encoding: gzip\r\n"
+
 
 class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps browser connections alive and allows chunked streaming responses.
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are dropped after this many seconds, so their threads exit.
+    timeout = KEEP_ALIVE_TIMEOUT
+
     def _send_json(self, payload: dict, status: int = HTTPStatus.OK) -> None:
-        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
+        self._send_json_bytes(_dumps(payload), status)
+
+    def _send_json_bytes(self, data: bytes, status: int = HTTPStatus.OK, gzipped: bytes | None = None) -> None:
+        # `gzipped` is a precompressed form of `data`, passed only when the client accepts gzip.
+        if gzipped is None and len(data) > GZIP_MIN_SIZE and self._accepts_gzip():
+            gzipped = gzip.compress(data, 5)
+        if gzipped is None:
+            self._write_response(status, _JSON_HEADERS, data)
+        else:
+            self._write_response(status, _JSON_GZ_HEADERS, gzipped)
+
+    def _write_response(self, status: int, headers: bytes, body: bytes = b"") -> None:
+        # Status line, headers and body leave in a single socket write instead of one per header.
+        self.log_request(status, len(body))
+        head = b"%s %d %s\r\nServer: %s\r\nDate: %s\r\n%s" % (
+            self.protocol_version.encode(),
+            status,
+            HTTPStatus(status).phrase.encode(),
+            self.version_string().encode(),
+            self.date_time_string().encode(),
+            headers,
+        )
+        if body or status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            head += b"Content-Length: %d\r\n" % len(body)
+        if self.close_connection:
+            head += b"Connection: close\r\n"
+        self.wfile.write(head + b"\r\n" + body)
+
+    def _accepts_gzip(self) -> bool:
+        for part in self.headers.get("Accept-Encoding", "").split(","):
+            coding, _, params = part.partition(";")
+            if coding.strip().lower() not in ("gzip", "*"):
+                continue
+            params = params.strip().lower()
+            if not params.startswith("q="):
+                return True
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return False
+
+    def _send_text_stream(self, chunks: Iterator[str]) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
         self.send_header("Cache-Control", "no-store")
         self.end_headers()
-        self.wfile.write(data)
+        try:
+            try:
+                for chunk in chunks:
+                    self._write_chunk(chunk.encode("utf-8"))
+            except RuntimeError as exc:
+                self._write_chunk(f"\n[Analysis interrupted: {exc}]".encode("utf-8"))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _write_chunk(self, data: bytes) -> None:
+        if data:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
 
     def _read_json(self) -> dict:
         size = int(self.headers.get("Content-Length", 0))
-        raw = self.rfile.read(size).decode("utf-8") if size else "{}"
-        return json.loads(raw or "{}")
+        raw = self.rfile.read(size) if size else b""
+        body = _loads(raw or b"{}")
+        if not isinstance(body, dict):
+            raise ValueError("request body is not a JSON object")
+        return body
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
         if parsed.path == "/":
-            body = INDEX_HTML.encode("utf-8")
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
-            self.send_header("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0")
-            self.send_header("Pragma", "no-cache")
-            self.send_header("Expires", "0")
-            self.end_headers()
-            self.wfile.write(body)
+            use_gzip = self._accepts_gzip()
+            etag = _INDEX_GZ_ETAG if use_gzip else _INDEX_ETAG
+            # Revalidate on every load (the page embeds the build) but skip the body when unchanged.
+            if self.headers.get("If-None-Match") == etag:
+                self._write_response(HTTPStatus.NOT_MODIFIED, _INDEX_GZ_304_HEADERS if use_gzip else _INDEX_304_HEADERS)
+                return
+            if use_gzip:
+                self._write_response(HTTPStatus.OK, _INDEX_GZ_HEADERS, _INDEX_GZ)
+            else:
+                self._write_response(HTTPStatus.OK, _INDEX_HEADERS, _INDEX_BYTES)
             return
 
         if parsed.path == "/favicon.ico":
-            self.send_response(HTTPStatus.NO_CONTENT)
-            self.end_headers()
+            self._write_response(HTTPStatus.NO_CONTENT, b"")
             return
 
         if parsed.path == "/api/state":
-            store = load_store()
-            self._send_json(
-                {
-                    "comments": store["comments"],
-                    "consolidated_comments": store["consolidated_comments"],
-                    "executive_summaries": store["executive_summaries"],
-                }
-            )
+            use_gzip = self._accepts_gzip()
+            with locked_store():
+                data = state_json()
+                gzipped = state_json_gz() if use_gzip and len(data) > GZIP_MIN_SIZE else None
+            self._send_json_bytes(data, gzipped=gzipped)
             return
 
         self._send_json({"error": "Not found"}, status=HTTPStatus.NOT_FOUND)
 
     def do_POST(self) -> None:  # noqa: N802
+        # Always consume the body first: on a kept-alive connection unread bytes would be parsed as the next request.
+        try:
+            body = self._read_json()
+        except ValueError:
+            self._send_json({"error": "Request body must be a JSON object."}, status=HTTPStatus.BAD_REQUEST)
+            return
+
         if self.path == "/api/reset":
             reset_store()
             self._send_json({"status": "ok"})
             return
 
         if self.path == "/api/comment":
-            body = self._read_json()
             text = (body.get("text") or "").strip()
             api_key = (body.get("api_key") or "").strip()
             suggest_improvements = bool(body.get("suggest_improvements", False))
@@ -574,45 +1344,76 @@ class Handler(BaseHTTPRequestHandler):
                 self._send_json({"requires_review": True, **result})
                 return
 
-            final_text = text
             try:
-                if normalize_english:
-                    final_text = translate_to_english_with_openai(api_key, final_text)
-
-                consolidated = consolidate_comment_with_openai(
+                processed = process_comment_with_openai(
                     api_key,
-                    final_text,
-                    tone_rules or "Use professional and consistent tone with strong readability.",
+                    text,
+                    tone_rules or DEFAULT_TONE_RULES,
+                    normalize_english,
                 )
             except RuntimeError as exc:
                 self._send_json({"error": str(exc)}, status=HTTPStatus.BAD_GATEWAY)
                 return
+            final_text = processed["translated"]
+            consolidated = processed["consolidated"]
+
+            with locked_store() as store:
+                comment_id = len(store["comments"]) + 1
+                now = utc_now()
+                comment = {"id": comment_id, "text": final_text, "created_at": now}
+                consolidated_row = {"comment_id": comment_id, "consolidated_text": consolidated, "created_at": now}
+                append_comments([comment], [consolidated_row])
+                schedule_executive_summary_refresh(api_key)
+
+            self._send_json({"status": "ok", "summary_pending": True})
+            return
 
-            store = load_store()
-            comment_id = len(store["comments"]) + 1
-
-            comment = Comment(id=comment_id, text=final_text, created_at=utc_now())
-            store["comments"].append(asdict(comment))
+        if self.path == "/api/comments/batch":
+            texts = body.get("texts")
+            api_key = (body.get("api_key") or "").strip()
+            normalize_english = bool(body.get("normalize_english", False))
+            tone_rules = (body.get("tone_rules") or "").strip()
 
-            consolidated_row = ConsolidatedComment(
-                comment_id=comment_id,
-                consolidated_text=consolidated,
-                created_at=utc_now(),
-            )
-            store["consolidated_comments"].append(asdict(consolidated_row))
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                self._send_json({"error": "'texts' must be a list of comment strings."}, status=HTTPStatus.BAD_REQUEST)
+                return
+            texts = [t.strip() for t in texts if t.strip()]
+            if not texts:
+                self._send_json({"error": "At least one comment text is required."}, status=HTTPStatus.BAD_REQUEST)
+                return
+            if len(texts) > COMMENT_BATCH_MAX_SIZE:
+                self._send_json(
+                    {"error": f"At most {COMMENT_BATCH_MAX_SIZE} comments can be submitted per batch."},
+                    status=HTTPStatus.BAD_REQUEST,
+                )
+                return
+            if not api_key:
+                self._send_json({"error": "OpenAI API key is required in configuration."}, status=HTTPStatus.BAD_REQUEST)
+                return
 
             try:
-                update_executive_summary_with_openai(store, api_key)
+                processed = consolidate_batch_with_openai(api_key, texts, tone_rules or DEFAULT_TONE_RULES, normalize_english)
             except RuntimeError as exc:
-                self._send_json({"error": f"Comment saved, but summary update failed: {exc}"}, status=HTTPStatus.BAD_GATEWAY)
+                self._send_json({"error": str(exc)}, status=HTTPStatus.BAD_GATEWAY)
                 return
 
-            save_store(store)
-            self._send_json({"status": "ok"})
+            with locked_store() as store:
+                first_id = len(store["comments"]) + 1
+                now = utc_now()
+                comments = []
+                consolidated_rows = []
+                for comment_id, result in enumerate(processed, start=first_id):
+                    comments.append({"id": comment_id, "text": result["translated"], "created_at": now})
+                    consolidated_rows.append(
+                        {"comment_id": comment_id, "consolidated_text": result["consolidated"], "created_at": now}
+                    )
+                append_comments(comments, consolidated_rows)
+                schedule_executive_summary_refresh(api_key)
+
+            self._send_json({"status": "ok", "saved": len(comments), "summary_pending": True})
             return
 
         if self.path == "/api/ask":
-            body = self._read_json()
             question = (body.get("question") or "").strip()
             api_key = (body.get("api_key") or "").strip()
             if not question:
@@ -621,23 +1422,100 @@ class Handler(BaseHTTPRequestHandler):
             if not api_key:
                 self._send_json({"error": "OpenAI API key is required in configuration."}, status=HTTPStatus.BAD_REQUEST)
                 return
-            store = load_store()
+            with locked_store() as store:
+                context = store["_context_cache"]
             try:
-                answer = answer_question_with_openai(api_key, question, store["consolidated_comments"])
+                answer = answer_question_with_openai(api_key, question, context)
             except RuntimeError as exc:
                 self._send_json({"error": str(exc)}, status=HTTPStatus.BAD_GATEWAY)
                 return
-            self._send_json({"answer": answer})
+            self._send_text_stream(answer)
             return
 
         self._send_json({"error": "Not found"}, status=HTTPStatus.NOT_FOUND)
 
 
+def _raise_keyboard_interrupt(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def _fork_workers(count: int) -> list[int]:
+    # Returns the worker pids in the parent and an empty list in each worker.
+    global _store_lock_file, _store_epoch
+    pids = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            # Workers shut down on SIGTERM from the supervisor just as they do on Ctrl-C.
+            signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+            # Opened after forking so each process gets its own lock (flock is per open file).
+            _store_lock_file = open(STORE_LOCK_PATH, "a+b")
+            fcntl.flock(_store_lock_file, fcntl.LOCK_SH)
+            _store_epoch = _read_store_epoch()
+            fcntl.flock(_store_lock_file, fcntl.LOCK_UN)
+            return []
+        pids.append(pid)
+    return pids
+
+
+def _supervise_workers(pids: list[int]) -> int:
+    # The parent does not serve: it forwards stop signals to the workers and reaps them as they exit.
+    # Returns the exit status for the parent: non-zero when the workers all exited without being asked to.
+    stopping = False
+
+    def stop(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in remaining:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    remaining = set(pids)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    while remaining:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        remaining.discard(pid)
+        if not stopping:
+            print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}", file=sys.stderr)
+    return 0 if stopping else 1
+
+
 def run() -> None:
-    ensure_store()
+    get_store()
+    load_openai_cache()
+    # Bound once, before forking: the workers share this listening socket, so the port stays exclusive.
     server = ThreadingHTTPServer((HOST, PORT), Handler)
-    print(f"Serving on http://{HOST}:{PORT}")
-    server.serve_forever()
+    workers = WORKERS if fcntl is not None and hasattr(os, "fork") else 1
+    if workers > 1:
+        # Every worker wakes up for a new connection; the ones that lose the accept must not block in it.
+        server.socket.setblocking(False)
+        pids = _fork_workers(workers)
+        if pids:
+            server.server_close()
+            print(f"Serving on http://{HOST}:{PORT} with {workers} worker processes")
+            sys.exit(_supervise_workers(pids))
+    else:
+        # A service stop or plain kill shuts down like Ctrl-C, so the OpenAI cache still gets saved.
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+        print(f"Serving on http://{HOST}:{PORT}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # A second Ctrl-C or SIGTERM must not cut the shutdown save short.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        server.server_close()
+        # Queued summary refreshes would each hold up interpreter exit; the running one is left to finish.
+        _SUMMARY_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        save_openai_cache()
 
 
 if __name__ == "__main__":